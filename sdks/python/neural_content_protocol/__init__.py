@@ -1,4 +1,4 @@
-from .validator import NcpValidator
+from .validator import NcpValidator, is_valid, validate, validate_batch, validate_cached
 
 __version__ = "1.0.0"
-__all__ = ["NcpValidator"]
+__all__ = ["NcpValidator", "validate", "is_valid", "validate_batch", "validate_cached"]
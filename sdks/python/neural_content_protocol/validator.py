@@ -1,155 +1,340 @@
+import json
+import threading
 import urllib.parse
+from collections import OrderedDict
 from datetime import datetime
 
-class NcpValidator:
+# LRU of validate() results keyed by raw NCP document + crawled domain.
+_CACHE_SIZE = 1024
+# Documents above the spec's 50KB payload cap are validated but not cached,
+# so the cache's memory stays bounded by _CACHE_SIZE * _CACHE_MAX_DOCUMENT.
+_CACHE_MAX_DOCUMENT = 50 * 1024
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+SEMANTIC_TYPES = frozenset({
+    'universal', 'product', 'article', 'organization', 'service', 'person', 'event'
+})
+
+_HTTPS = 'https://'
+_HTTPS_LEN = len(_HTTPS)
+
+# external_signals is capped at 20 entries, so every error path is known upfront.
+_SIGNAL_PATHS = tuple(f'$.authority.external_signals[{idx}]' for idx in range(20))
+
+# Every error validate() can report, built once at import. _add_error() hands
+# out copies, so results never share (or can corrupt) these dicts.
+_ERROR_TEMPLATES = {
+    code: {"code": code, "severity": severity, "message": message, "path": path}
+    for code, severity, message, path in (
+        ('PAYLOAD_INVALID', 'BLOCKING', 'Input must be a valid JSON dictionary.', '$'),
+        ('PROTOCOL_INVALID', 'BLOCKING', 'protocol MUST be exact string "NCP/1.0".', '$.protocol'),
+        ('SEMANTIC_TYPE_MISSING', 'BLOCKING', 'semantic_type MUST be a string.', '$.semantic_type'),
+        ('SEMANTIC_TYPE_UNKNOWN', 'WARNING', "semantic_type '{}' is not an official v1.0 enum.", '$.semantic_type'),
+        ('IDENTITY_MISSING', 'BLOCKING', 'Identity object is REQUIRED.', '$.identity'),
+        ('IDENTITY_NAME_INVALID', 'BLOCKING', 'Identity name MUST be string between 3 and 120 chars.', '$.identity.name'),
+        ('IDENTITY_URL_INVALID', 'BLOCKING', 'Identity url MUST be absolute HTTPS URL.', '$.identity.url'),
+        ('ORIGIN_MISMATCH', 'WARNING', "Payload URL domain ({}) != crawled domain ({}).", '$.identity.url'),
+        ('IDENTITY_URL_MALFORMED', 'BLOCKING', 'Identity url is completely malformed.', '$.identity.url'),
+        ('AUTHORITY_MISSING', 'BLOCKING', 'Authority object is REQUIRED.', '$.authority'),
+        ('AUTHORITY_VERIFIED_INVALID', 'BLOCKING', 'Authority verified MUST be boolean.', '$.authority.verified'),
+        ('AUTHORITY_SCORE_INVALID', 'BLOCKING', 'Authority trust_score MUST be float between 0.0 and 10.0.', '$.authority.trust_score'),
+        ('AUTHORITY_SIGNALS_INVALID', 'BLOCKING', 'Authority external_signals MUST be array max 20.', '$.authority.external_signals'),
+        ('AUTHORITY_SIGNAL_MALFORMED', 'BLOCKING', 'All external_signals MUST be objects containing type and url.', '$.authority.external_signals[*]'),
+        ('ENTITIES_MISSING', 'BLOCKING', 'Entities object is REQUIRED.', '$.entities'),
+        ('ENTITIES_PRIMARY_INVALID', 'BLOCKING', 'Entities primary MUST be array 1-10 elements.', '$.entities.primary'),
+        ('OFFER_MISSING', 'BLOCKING', 'Offer object is REQUIRED.', '$.offer'),
+        ('OFFER_CURRENCY_MISSING', 'BLOCKING', 'Offer currency is REQUIRED when price is present.', '$.offer.currency'),
+        ('CONTEXT_MISSING', 'BLOCKING', 'Context object is REQUIRED.', '$.context'),
+        ('CONTEXT_TIMESTAMP_INVALID', 'BLOCKING', 'Context timestamp MUST be valid ISO 8601 date.', '$.context.timestamp'),
+        ('CONTEXT_SUMMARY_LENGTH', 'WARNING', 'Context summary suspiciously short (< 50 chars).', '$.context.summary'),
+    )
+}
+
+# Result list each severity is reported under; anything else is a recommendation.
+_SEVERITY_BUCKET = {'BLOCKING': 'blocking_errors', 'WARNING': 'warnings'}
+
+def _copy_result(result: dict) -> dict:
+    # Results are flat apart from the three lists of flat error dicts, so
+    # this is a full copy at a fraction of the cost of copy.deepcopy().
+    copied = dict(result)
+    for key in ('blocking_errors', 'warnings', 'recommendations'):
+        copied[key] = [dict(error_obj) for error_obj in result[key]]
+    return copied
+
+def _load_document(document):
+    # Undecodable or absurdly nested documents come back as None, which
+    # validate() reports as PAYLOAD_INVALID.
+    try:
+        return json.loads(document)
+    except (ValueError, RecursionError):
+        return None
+
+def _normalize_host(domain: str) -> str:
+    # None (not '') for a missing domain, so a domain that normalizes to ''
+    # (e.g. 'www.') still goes through the origin check. Non-str domains are
+    # passed through untouched; the origin check reports them as
+    # IDENTITY_URL_MALFORMED instead of raising out of validate().
+    if not domain:
+        return None
+    return domain.replace('www.', '') if isinstance(domain, str) else domain
+
+def _url_host(url: str) -> str:
     """
-    Neural Content Protocol (NCP) v1.0 Validator
-    Official implementation by SEOExtreme
+    Lowercased hostname of an https:// URL, as urlparse().hostname would give.
+    Plain ASCII hosts are sliced out directly; IPv6 literals, %-escapes,
+    non-ASCII hosts and URLs with tabs/newlines (which urlsplit strips) go
+    through urlparse.
     """
-    
-    SEMANTIC_TYPES = [
-        'universal', 'product', 'article', 'organization', 'service', 'person', 'event'
-    ]
-
-    def _add_error(self, code: str, message: str, path: str, severity: str, status_ref: dict):
-        error_obj = {"code": code, "severity": severity, "message": message, "path": path}
-        if severity == 'BLOCKING':
-            status_ref['blocking_errors'].append(error_obj)
-        elif severity == 'WARNING':
-            status_ref['warnings'].append(error_obj)
-        else:
-            status_ref['recommendations'].append(error_obj)
-
-    def validate(self, payload: dict, crawled_domain: str = None) -> dict:
-        result = {
-            "ncp_version": "1.0",
-            "status": "FAIL",
-            "compliance_level": "NONE",
-            "score": 100,
-            "blocking_errors": [],
-            "warnings": [],
-            "recommendations": []
-        }
-
-        if not isinstance(payload, dict):
-            self._add_error('PAYLOAD_INVALID', 'Input must be a valid JSON dictionary.', '$', 'BLOCKING', result)
-            return result
-
-        # 1. Protocol
-        if payload.get('protocol') != 'NCP/1.0':
-            self._add_error('PROTOCOL_INVALID', 'protocol MUST be exact string "NCP/1.0".', '$.protocol', 'BLOCKING', result)
-
-        # 2. Semantic Type
-        sem_type = payload.get('semantic_type')
-        if not isinstance(sem_type, str):
-            self._add_error('SEMANTIC_TYPE_MISSING', 'semantic_type MUST be a string.', '$.semantic_type', 'BLOCKING', result)
-        elif sem_type not in self.SEMANTIC_TYPES:
-            self._add_error('SEMANTIC_TYPE_UNKNOWN', f"semantic_type '{sem_type}' is not an official v1.0 enum.", '$.semantic_type', 'WARNING', result)
-            result['score'] -= 10
-
-        # 3. Identity
-        identity = payload.get('identity')
-        if not isinstance(identity, dict):
-            self._add_error('IDENTITY_MISSING', 'Identity object is REQUIRED.', '$.identity', 'BLOCKING', result)
-        else:
-            name = identity.get('name')
-            if not isinstance(name, str) or len(name) < 3 or len(name) > 120:
-                self._add_error('IDENTITY_NAME_INVALID', 'Identity name MUST be string between 3 and 120 chars.', '$.identity.name', 'BLOCKING', result)
-            
-            url = identity.get('url')
-            if not isinstance(url, str) or not url.startswith('https://'):
-                self._add_error('IDENTITY_URL_INVALID', 'Identity url MUST be absolute HTTPS URL.', '$.identity.url', 'BLOCKING', result)
-            elif crawled_domain:
-                try:
-                    parsed_url = urllib.parse.urlparse(url)
-                    payload_host = parsed_url.hostname.replace('www.', '') if parsed_url.hostname else ''
-                    crawled_host = crawled_domain.replace('www.', '')
-                    if payload_host != crawled_host:
-                        self._add_error('ORIGIN_MISMATCH', f"Payload URL domain ({payload_host}) != crawled domain ({crawled_host}).", '$.identity.url', 'WARNING', result)
-                        result['score'] -= 20
-                except Exception:
-                    self._add_error('IDENTITY_URL_MALFORMED', 'Identity url is completely malformed.', '$.identity.url', 'BLOCKING', result)
-
-        # 4. Authority
-        authority = payload.get('authority')
-        if not isinstance(authority, dict):
-            self._add_error('AUTHORITY_MISSING', 'Authority object is REQUIRED.', '$.authority', 'BLOCKING', result)
-        else:
-            if not isinstance(authority.get('verified'), bool):
-                self._add_error('AUTHORITY_VERIFIED_INVALID', 'Authority verified MUST be boolean.', '$.authority.verified', 'BLOCKING', result)
-            
-            score = authority.get('trust_score')
-            if not isinstance(score, (int, float)) or score < 0 or score > 10:
-                self._add_error('AUTHORITY_SCORE_INVALID', 'Authority trust_score MUST be float between 0.0 and 10.0.', '$.authority.trust_score', 'BLOCKING', result)
-            
-            signals = authority.get('external_signals')
-            if not isinstance(signals, list) or len(signals) > 20:
-                self._add_error('AUTHORITY_SIGNALS_INVALID', 'Authority external_signals MUST be array max 20.', '$.authority.external_signals', 'BLOCKING', result)
-            else:
-                for idx, sig in enumerate(signals):
-                    if not isinstance(sig, dict) or 'type' not in sig or 'url' not in sig:
-                        self._add_error('AUTHORITY_SIGNAL_MALFORMED', 'All external_signals MUST be objects containing type and url.', f'$.authority.external_signals[{idx}]', 'BLOCKING', result)
-
-        # 5. Entities
-        entities = payload.get('entities')
-        if not isinstance(entities, dict):
-            self._add_error('ENTITIES_MISSING', 'Entities object is REQUIRED.', '$.entities', 'BLOCKING', result)
-        else:
-            primary = entities.get('primary')
-            if not isinstance(primary, list) or len(primary) == 0 or len(primary) > 10:
-                self._add_error('ENTITIES_PRIMARY_INVALID', 'Entities primary MUST be array 1-10 elements.', '$.entities.primary', 'BLOCKING', result)
-
-        # 6. Offer
-        offer = payload.get('offer')
-        if not isinstance(offer, dict):
-            self._add_error('OFFER_MISSING', 'Offer object is REQUIRED.', '$.offer', 'BLOCKING', result)
-        else:
-            if offer.get('price') is not None:
-                if not isinstance(offer.get('currency'), str):
-                    self._add_error('OFFER_CURRENCY_MISSING', 'Offer currency is REQUIRED when price is present.', '$.offer.currency', 'BLOCKING', result)
-
-        # 7. Context
-        context = payload.get('context')
-        if not isinstance(context, dict):
-            self._add_error('CONTEXT_MISSING', 'Context object is REQUIRED.', '$.context', 'BLOCKING', result)
-        else:
-            timestamp = context.get('timestamp')
+    end = len(url)
+    for sep in '/?#':
+        idx = url.find(sep, _HTTPS_LEN)
+        if 0 <= idx < end:
+            end = idx
+    netloc = url[_HTTPS_LEN:end]
+    if netloc.isascii() and '[' not in netloc and ']' not in netloc and '%' not in netloc and \
+            '\t' not in url and '\n' not in url and '\r' not in url:
+        return netloc.rpartition('@')[2].partition(':')[0].lower()
+    return urllib.parse.urlparse(url).hostname or ''
+
+def _fail(result: dict) -> dict:
+    result['status'] = 'FAIL'
+    result['compliance_level'] = 'NONE'
+    result['score'] = 0
+    return result
+
+def _add_error(code: str, status_ref: dict, *message_args, path: str = None):
+    error_obj = _ERROR_TEMPLATES[code].copy()
+    if message_args:
+        error_obj['message'] = error_obj['message'].format(*message_args)
+    if path is not None:
+        error_obj['path'] = path
+    status_ref[_SEVERITY_BUCKET.get(error_obj['severity'], 'recommendations')].append(error_obj)
+
+def validate(payload: dict, crawled_domain: str = None, fail_fast: bool = False) -> dict:
+    """
+    Validate a parsed NCP payload. With fail_fast, validation stops at the
+    first section that raises a blocking error, so the FAIL result only
+    lists the errors found up to that point.
+    """
+    return _validate(payload, _normalize_host(crawled_domain), fail_fast)
+
+def is_valid(payload: dict, crawled_domain: str = None) -> bool:
+    """Pass/fail gate that stops at the first blocking error."""
+    return _validate(payload, _normalize_host(crawled_domain), True)['status'] == 'PASS'
+
+def _validate(payload: dict, crawled_host: str, fail_fast: bool = False) -> dict:
+    # crawled_host is the crawled domain already passed through
+    # _normalize_host() (None skips the origin check), so batches only
+    # normalize it once.
+    result = {
+        "ncp_version": "1.0",
+        "status": "FAIL",
+        "compliance_level": "NONE",
+        "score": 100,
+        "blocking_errors": [],
+        "warnings": [],
+        "recommendations": []
+    }
+    origin_mismatch = False
+
+    if not isinstance(payload, dict):
+        _add_error('PAYLOAD_INVALID', result)
+        return result
+
+    # 1. Protocol
+    if payload.get('protocol') != 'NCP/1.0':
+        _add_error('PROTOCOL_INVALID', result)
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 2. Semantic Type
+    sem_type = payload.get('semantic_type')
+    is_enum = False
+    if not isinstance(sem_type, str):
+        _add_error('SEMANTIC_TYPE_MISSING', result)
+    elif sem_type not in SEMANTIC_TYPES:
+        _add_error('SEMANTIC_TYPE_UNKNOWN', result, sem_type)
+        result['score'] -= 10
+    else:
+        is_enum = True
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 3. Identity
+    identity = payload.get('identity')
+    if not isinstance(identity, dict):
+        _add_error('IDENTITY_MISSING', result)
+    else:
+        name = identity.get('name')
+        if not isinstance(name, str) or len(name) < 3 or len(name) > 120:
+            _add_error('IDENTITY_NAME_INVALID', result)
+        
+        url = identity.get('url')
+        if not isinstance(url, str) or url[:_HTTPS_LEN] != _HTTPS:
+            _add_error('IDENTITY_URL_INVALID', result)
+        elif crawled_host is not None:
             try:
-                # Basic ISO 8601 sanity check
-                if not isinstance(timestamp, str): raise ValueError
-                datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            except (ValueError, TypeError):
-                self._add_error('CONTEXT_TIMESTAMP_INVALID', 'Context timestamp MUST be valid ISO 8601 date.', '$.context.timestamp', 'BLOCKING', result)
-            
-            summary = context.get('summary')
-            if isinstance(summary, str) and len(summary) < 50:
-                self._add_error('CONTEXT_SUMMARY_LENGTH', 'Context summary suspiciously short (< 50 chars).', '$.context.summary', 'WARNING', result)
+                if not isinstance(crawled_host, str):
+                    raise TypeError('crawled_domain must be a string')
+                payload_host = _url_host(url).replace('www.', '')
+                if payload_host != crawled_host:
+                    _add_error('ORIGIN_MISMATCH', result, payload_host, crawled_host)
+                    result['score'] -= 20
+                    origin_mismatch = True
+            except Exception:
+                _add_error('IDENTITY_URL_MALFORMED', result)
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 4. Authority
+    authority = payload.get('authority')
+    if not isinstance(authority, dict):
+        _add_error('AUTHORITY_MISSING', result)
+    else:
+        verified = authority.get('verified')
+        if type(verified) is not bool:
+            _add_error('AUTHORITY_VERIFIED_INVALID', result)
+        
+        # Exact type checks: bools are ints to isinstance() but not scores.
+        score = authority.get('trust_score')
+        score_type = type(score)
+        if (score_type is not int and score_type is not float) or not 0 <= score <= 10:
+            _add_error('AUTHORITY_SCORE_INVALID', result)
+        
+        signals = authority.get('external_signals')
+        if not isinstance(signals, list) or len(signals) > 20:
+            _add_error('AUTHORITY_SIGNALS_INVALID', result)
+        else:
+            for idx, sig in enumerate(signals):
+                if not isinstance(sig, dict) or 'type' not in sig or 'url' not in sig:
+                    _add_error('AUTHORITY_SIGNAL_MALFORMED', result, path=_SIGNAL_PATHS[idx])
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 5. Entities
+    entities = payload.get('entities')
+    if not isinstance(entities, dict):
+        _add_error('ENTITIES_MISSING', result)
+    else:
+        primary = entities.get('primary')
+        if not isinstance(primary, list) or len(primary) == 0 or len(primary) > 10:
+            _add_error('ENTITIES_PRIMARY_INVALID', result)
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 6. Offer
+    offer = payload.get('offer')
+    if not isinstance(offer, dict):
+        _add_error('OFFER_MISSING', result)
+    else:
+        if offer.get('price') is not None:
+            if not isinstance(offer.get('currency'), str):
+                _add_error('OFFER_CURRENCY_MISSING', result)
+    if fail_fast and result['blocking_errors']: return _fail(result)
+
+    # 7. Context
+    context = payload.get('context')
+    if not isinstance(context, dict):
+        _add_error('CONTEXT_MISSING', result)
+    else:
+        timestamp = context.get('timestamp')
+        try:
+            # Basic ISO 8601 sanity check
+            if not isinstance(timestamp, str): raise ValueError
+            datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            _add_error('CONTEXT_TIMESTAMP_INVALID', result)
+        
+        summary = context.get('summary')
+        has_long_summary = False
+        if isinstance(summary, str):
+            if len(summary) < 50:
+                _add_error('CONTEXT_SUMMARY_LENGTH', result)
                 result['score'] -= 5
+            else:
+                has_long_summary = True
 
-        # --- Compliance Level Algorithm ---
-        if result['blocking_errors']:
-            result['status'] = 'FAIL'
-            result['compliance_level'] = 'NONE'
-            result['score'] = 0
-            return result
+    # --- Compliance Level Algorithm ---
+    if result['blocking_errors']:
+        return _fail(result)
 
-        result['status'] = 'PASS'
-        result['compliance_level'] = 'CORE'
+    result['status'] = 'PASS'
+    result['compliance_level'] = 'CORE'
 
-        is_enum = sem_type in self.SEMANTIC_TYPES
-        has_long_summary = context and isinstance(context.get('summary'), str) and len(context.get('summary')) >= 50
-        has_signals = authority and isinstance(authority.get('external_signals'), list) and len(authority.get('external_signals')) > 0
+    # Without blocking errors every section ran to completion, so is_enum and
+    # has_long_summary were set by the checks above and signals is a list.
+    has_signals = len(signals) > 0
 
-        if is_enum and has_long_summary and has_signals:
-            result['compliance_level'] = 'PLUS'
-            
-            # VERIFIED-L1 Check
-            has_origin_warning = any(w['code'] == 'ORIGIN_MISMATCH' for w in result['warnings'])
-            is_https = isinstance(identity, dict) and isinstance(identity.get('url'), str) and identity.get('url').startswith('https://')
-            is_verified = authority and authority.get('verified') is True
-            high_trust = authority and isinstance(authority.get('trust_score'), (int, float)) and authority.get('trust_score') >= 7.0
+    if is_enum and has_long_summary and has_signals:
+        result['compliance_level'] = 'PLUS'
+        
+        # VERIFIED-L1 Check
+        # No blocking errors means identity.url was already checked to be
+        # HTTPS and verified/trust_score were type checked, so reuse the
+        # values bound above instead of reading them from the payload again.
+        is_verified = verified is True
+        high_trust = score >= 7.0
 
-            if is_https and is_verified and high_trust and not has_origin_warning:
-                result['compliance_level'] = 'VERIFIED-L1'
+        if is_verified and high_trust and not origin_mismatch:
+            result['compliance_level'] = 'VERIFIED-L1'
 
-        return result
+    return result
+
+def validate_batch(payloads: list, crawled_domains=None) -> list:
+    """
+    Validate a list of payloads in one call. crawled_domains is either a
+    single domain applied to every payload or a list aligned with payloads.
+    Every entry of the returned list is a fresh result dict.
+    """
+    if crawled_domains is None or isinstance(crawled_domains, str):
+        crawled_host = _normalize_host(crawled_domains)
+        return [_validate(payload, crawled_host) for payload in payloads]
+    if len(crawled_domains) != len(payloads):
+        raise ValueError('crawled_domains must be a single domain or match payloads in length.')
+    return [_validate(payload, _normalize_host(domain)) for payload, domain in zip(payloads, crawled_domains)]
+
+def validate_cached(document, crawled_domain: str = None) -> dict:
+    """
+    Validate a raw NCP document (the JSON text/bytes as fetched), memoizing
+    results so repeat submissions of the same document skip both parsing
+    and validation. Every call returns a fresh result dict.
+
+    Already-parsed dicts are validated directly: canonically serializing
+    one to build a cache key costs more than validating it.
+    """
+    if not isinstance(document, (str, bytes)):
+        return validate(document, crawled_domain)
+    if len(document) > _CACHE_MAX_DOCUMENT:
+        return validate(_load_document(document), crawled_domain)
+
+    key = (document, crawled_domain)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return _copy_result(cached)
+
+    result = validate(_load_document(document), crawled_domain)
+    with _cache_lock:
+        _cache[key] = _copy_result(result)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+class NcpValidator:
+    """
+    Neural Content Protocol (NCP) v1.0 Validator
+    Official implementation by SEOExtreme
+
+    Kept for backward compatibility; the methods are the module-level
+    functions, so no bound method or self is involved per call.
+
+    SEMANTIC_TYPES is exposed read-only for existing callers: validation
+    always uses the module-level set, so overriding it (or any method) in
+    a subclass has no effect on the results.
+    """
+    
+    __slots__ = ()
+
+    SEMANTIC_TYPES = SEMANTIC_TYPES
+
+    validate = staticmethod(validate)
+    is_valid = staticmethod(is_valid)
+    validate_batch = staticmethod(validate_batch)
+    validate_cached = staticmethod(validate_cached)
@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+
+from neural_content_protocol import NcpValidator, validator
+
+validator_instance = NcpValidator()
+
+# Load the official test suites from the repo
+suite_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'test-suite')
+with open(os.path.join(suite_dir, 'pass_vectors.json'), encoding='utf-8') as f:
+    pass_suite = json.load(f)
+with open(os.path.join(suite_dir, 'fail_vectors.json'), encoding='utf-8') as f:
+    fail_suite = json.load(f)
+
+checks = 0
+failures = 0
+
+def check(condition, label):
+    global checks, failures
+    checks += 1
+    if condition:
+        print(f'✅ {label}')
+    else:
+        failures += 1
+        print(f'❌ {label}')
+
+print('--- RUNNING NCP v1.0 PYTHON VALIDATOR TESTS ---\n')
+
+print('--- 1. PASS VECTORS ---')
+for i, vector in enumerate(pass_suite['vectors']):
+    # For origin matching testing, we simulate crawling from seoextreme.org
+    result = validator_instance.validate(vector, 'seoextreme.org')
+    check(result['status'] == 'PASS', f"Vector {i + 1} passes (Level: {result['compliance_level']}).")
+
+print('\n--- 2. FAIL VECTORS ---')
+for test_case in fail_suite['vectors']:
+    result = validator_instance.validate(test_case['payload'])
+    check(result['status'] == 'FAIL', f"{test_case['title']} fails (Errors: {len(result['blocking_errors'])}).")
+
+print('\n--- 3. validate_cached ---')
+validator._cache.clear()
+document = json.dumps(pass_suite['vectors'][0])
+first = validator.validate_cached(document, 'seoextreme.org')
+check(first == validator.validate(pass_suite['vectors'][0], 'seoextreme.org'), 'Cached result matches validate().')
+first['status'] = 'MUTATED'
+first['blocking_errors'].append({'code': 'MUTATED'})
+second = validator.validate_cached(document, 'seoextreme.org')
+check(second['status'] == 'PASS' and not second['blocking_errors'], 'Mutating a returned result does not leak into later hits.')
+check(second is not validator.validate_cached(document, 'seoextreme.org'), 'Every hit returns a fresh dict.')
+check(validator.validate_cached(document, 'other.com')['compliance_level'] == 'PLUS', 'Crawled domain is part of the cache key.')
+check(validator.validate_cached('{not json')['blocking_errors'][0]['code'] == 'PAYLOAD_INVALID', 'Undecodable document is PAYLOAD_INVALID.')
+check(validator.validate_cached('[' * 5000)['blocking_errors'][0]['code'] == 'PAYLOAD_INVALID', 'Deeply nested document is PAYLOAD_INVALID.')
+
+validator._cache.clear()
+oversized = document + ' ' * validator._CACHE_MAX_DOCUMENT
+check(validator.validate_cached(oversized)['status'] == 'PASS' and not validator._cache, 'Documents over the size cap are not cached.')
+
+validator._cache.clear()
+documents = [document + ' ' * i for i in range(validator._CACHE_SIZE + 1)]
+for doc in documents[:validator._CACHE_SIZE]:
+    validator.validate_cached(doc)
+validator.validate_cached(documents[0])  # touch the oldest entry
+validator.validate_cached(documents[-1])  # evicts the least recently used
+check(len(validator._cache) == validator._CACHE_SIZE, 'Cache size stays bounded.')
+check((documents[0], None) in validator._cache and (documents[1], None) not in validator._cache, 'Least recently used entry is evicted.')
+validator._cache.clear()
+
+print('\n--- 4. validate_batch ---')
+vectors = pass_suite['vectors']
+batch = validator.validate_batch(vectors, 'seoextreme.org')
+check(batch == [validator.validate(v, 'seoextreme.org') for v in vectors], 'One crawled domain applies to every payload.')
+check(len({id(result) for result in batch}) == len(batch), 'Every batch entry is a fresh dict.')
+domains = ['seoextreme.org', 'other.com'] + ['seoextreme.org'] * (len(vectors) - 2)
+batch = validator.validate_batch(vectors, domains)
+check([result['compliance_level'] for result in batch[:2]] == ['VERIFIED-L1', 'PLUS'], 'Per-payload domain list is aligned with payloads.')
+try:
+    validator.validate_batch(vectors, ['seoextreme.org'])
+    check(False, 'Length mismatch raises ValueError.')
+except ValueError:
+    check(True, 'Length mismatch raises ValueError.')
+
+print('\n--- 5. is_valid / fail_fast ---')
+for i, vector in enumerate(pass_suite['vectors']):
+    check(validator.is_valid(vector, 'seoextreme.org'), f'Pass vector {i + 1} is_valid().')
+    check(validator.validate(vector, 'seoextreme.org', fail_fast=True) == validator.validate(vector, 'seoextreme.org'),
+          f'Pass vector {i + 1} result is unchanged by fail_fast.')
+for test_case in fail_suite['vectors']:
+    check(not validator.is_valid(test_case['payload']), f"{test_case['title']} is not is_valid().")
+result = validator.validate(fail_suite['vectors'][0]['payload'], fail_fast=True)
+check(result['status'] == 'FAIL' and result['score'] == 0, 'fail_fast still returns a finalized FAIL result.')
+check([e['code'] for e in result['blocking_errors']] == ['PROTOCOL_INVALID'], 'fail_fast stops after the first failing section.')
+check(NcpValidator().is_valid(pass_suite['vectors'][0]), 'NcpValidator exposes is_valid().')
+
+print('\n--- 6. Origin check ---')
+result = validator.validate(pass_suite['vectors'][0], 'www.')
+check(result['compliance_level'] == 'PLUS' and result['warnings'][0]['code'] == 'ORIGIN_MISMATCH',
+      "Crawled domain 'www.' still runs the origin check.")
+check(validator.validate(pass_suite['vectors'][0], '')['compliance_level'] == 'VERIFIED-L1', 'Empty crawled domain skips the origin check.')
+
+for domain in (b'seoextreme.org', 5):
+    result = validator.validate(pass_suite['vectors'][0], domain)
+    check([e['code'] for e in result['blocking_errors']] == ['IDENTITY_URL_MALFORMED'],
+          f'Non-str crawled domain {domain!r} is reported as IDENTITY_URL_MALFORMED.')
+    check(not validator.is_valid(pass_suite['vectors'][0], domain), f'Non-str crawled domain {domain!r} is not is_valid().')
+    check(validator.validate_batch(pass_suite['vectors'][:1], [domain])[0]['status'] == 'FAIL',
+          f'Non-str crawled domain {domain!r} does not raise out of validate_batch().')
+
+print('\n--- 7. trust_score types ---')
+for label, trust_score in (('true', True), ('false', False), ('NaN', json.loads('NaN'))):
+    payload = json.loads(json.dumps(pass_suite['vectors'][0]))
+    payload['authority']['trust_score'] = trust_score
+    result = validator.validate(payload, 'seoextreme.org')
+    check([e['code'] for e in result['blocking_errors']] == ['AUTHORITY_SCORE_INVALID'],
+          f'trust_score {label} is AUTHORITY_SCORE_INVALID.')
+
+print(f'\nRESULTS: {checks - failures}/{checks} checks OK.')
+if failures:
+    sys.exit(1)
+print('🎉 Python SDK is structurally sound and compliant with v1.0 specifications.')